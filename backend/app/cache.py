@@ -0,0 +1,58 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+
+def cache_key(*parts: object) -> str:
+    """Stable sha256 key for a tuple of prompt inputs."""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Async-safe LRU cache for LLM responses.
+
+    Concurrent callers asking for the same key share a single in-flight
+    computation instead of each firing their own LLM call. Failures are
+    not cached.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        store: bool = True,
+    ) -> Any:
+        """
+        Return the cached value for key, or run compute() once for all
+        concurrent callers. With store=False the result is only shared with
+        callers already waiting on it, never kept for later requests.
+        """
+        if store and key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t, store))
+
+        # shield so one caller disconnecting doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task, store: bool) -> None:
+        self._inflight.pop(key, None)
+        if not store or task.cancelled() or task.exception() is not None:
+            return
+
+        self._data[key] = task.result()
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
@@ -1,11 +1,7 @@
-import os
-from dotenv import load_dotenv
+from app.settings import get_settings
 
-load_dotenv()
+settings = get_settings()
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-MODEL_NAME = os.getenv("MODEL_NAME", "gpt-5.1") 
-TEMPERATURE = float(os.getenv("MODEL_TEMPERATURE", "0.2"))  # low = less random
-
-if not OPENAI_API_KEY:
-    raise RuntimeError("OPENAI_API_KEY is not set in environment or .env")
+OPENAI_API_KEY = settings.openai_api_key
+MODEL_NAME = settings.model_name
+TEMPERATURE = settings.model_temperature  # low = less random
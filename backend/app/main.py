@@ -1,191 +1,307 @@
-import os
-import json
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
 from textwrap import dedent
+from typing import AsyncIterator, Awaitable, Callable
+from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-
-from app.schemas import StartupRequest, StartupPlan
-
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-ENV_PATH = os.path.join(BASE_DIR, ".env")
-
-def load_env_from_file(path: str) -> None:
-    """Simple .env loader: KEY=VALUE per line."""
-    if not os.path.exists(path):
-        print(f"[ENV] .env file not found at: {path}")
-        return
-    print(f"[ENV] Loading env from: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-            # don't override if already in environment
-            os.environ.setdefault(key, value)
-
-load_env_from_file(ENV_PATH)
-
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-MODEL_NAME = os.getenv("MODEL_NAME", "gpt-4.1-mini")
-MODEL_TEMPERATURE = float(os.getenv("MODEL_TEMPERATURE", "0.4"))
-
-if not OPENAI_API_KEY:
-    # Helpful debug info
-    raise RuntimeError(f"OPENAI_API_KEY is not set. Checked .env at: {ENV_PATH}")
-
-from crewai import Agent, Task, Crew, Process, LLM
-from openai import OpenAI
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-llm = LLM(
-    model=MODEL_NAME,
-    api_key=OPENAI_API_KEY,
-    temperature=MODEL_TEMPERATURE,
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.cache import ResponseCache, cache_key
+from app.schemas import (
+    StartupRequest,
+    StartupPlan,
+    GeneratedStartupPlan,
+    StartupPlanBatch,
+    CritiqueRequest,
+    PitchRequest,
+    BundleRequest,
+    Slide,
+    PDFRequest,
+    CritiqueResponse,
+    PitchResponse,
+    BundleResponse,
+    FullResponse,
+    PlanRunCreated,
+    PlanRun,
 )
+from app.runs import RunStore, create_run_store
+from app.settings import get_settings
 
-startup_orchestrator = Agent(
-    role="Startup Builder Orchestrator",
-    goal=(
-        "Given a startup idea, act as a crew of specialists (market analyst, "
-        "business model architect, technical architect, roadmap planner, GTM strategist) "
-        "and produce a realistic startup blueprint in STRICT JSON."
-    ),
-    backstory=(
-        "You have helped many founders refine messy ideas into clear, structured plans. "
-        "You hate hallucinating. If details are unknown, you explicitly say 'Unknown' or "
-        "'Best guess: ...' instead of making up fake numbers or companies."
-    ),
-    llm=llm,
-    verbose=True,
-)
+settings = get_settings()
 
-def run_startup_crew(idea: str) -> dict:
-    """
-    Use a CrewAI Agent to generate a structured startup plan as JSON.
-    """
-    description = dedent(f"""
-    You are a CREW of startup specialists working together:
+OPENAI_API_KEY = settings.openai_api_key
+MODEL_NAME = settings.model_name
+MODEL_TEMPERATURE = settings.model_temperature
+
+from crewai import Agent, Task, Crew, CrewOutput, Process, LLM
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# (task description, expected output, output_json model) -> Crew
+CrewFactory = Callable[[str, str, type[BaseModel]], Crew]
 
-    - Market Analyst
-    - Business Model Architect
-    - Technical Architect
-    - MVP Roadmap Planner
-    - Go-To-Market Strategist
+# identical inputs (retries, double-submits, demos) skip the LLM entirely
+response_cache = ResponseCache(maxsize=1024)
 
-    Your job: turn this raw idea into an ACTIONABLE startup plan.
+SLIDES_ADAPTER = TypeAdapter(list[Slide])
+
+# Prompts are dedented once at import; requests only str.replace the
+# placeholders (str.format would trip over the JSON braces). The JSON
+# schema itself comes from the Task's output_json model, not the prose.
+PLAN_PROMPT = dedent("""
+    As a crew of startup specialists (market analyst, business model architect, technical architect, MVP roadmap planner, GTM strategist), turn this raw idea into an ACTIONABLE startup plan.
 
     IDEA:
-    "{idea}"
-
-    RULES:
-    - Be practical and realistic.
-    - Focus on THIS specific idea, not generic startup advice.
-    - If something is not obvious, write "Unknown" or "Best guess: ...".
-    - DO NOT invent fake metrics, fake statistics, or fake company names.
-    - Respond ONLY with a SINGLE JSON object. No markdown, no ``` fences, no explanation before or after.
-    - Keep each field 3–8 sentences max.
-
-    Use EXACTLY this JSON schema and keys:
-
-    {{
-      "idea": "string - restate the idea clearly in your own words",
-      "problem_summary": "string - describe the core pain/need being solved",
-      "solution_summary": "string - describe the actual product / service and how it works",
-      "target_audience": "string - 2-3 main personas + their characteristics and pain points",
-      "market_and_competition": "string - how people solve this today, types of competitors, and differentiation",
-      "revenue_model": "string - business model, pricing logic, potential tiers",
-      "tech_architecture": "string - high-level architecture: frontend, backend, DB, AI components, integrations",
-      "mvp_roadmap": "string - realistic 4-8 week roadmap in phases or weeks",
-      "launch_strategy": "string - first launch channels, first 100 users, and feedback loop"
-    }}
-
-    EXAMPLE OF FORMAT (STRUCTURE ONLY, CONTENT IS FAKE):
-
-    {{
-      "idea": "AI assistant for X ...",
-      "problem_summary": "People today struggle with ...",
-      "solution_summary": "This product will ...",
-      "target_audience": "The main personas are ...",
-      "market_and_competition": "Today, people use ...",
-      "revenue_model": "SaaS monthly with ...",
-      "tech_architecture": "Next.js frontend, FastAPI backend, Postgres, OpenAI API ...",
-      "mvp_roadmap": "Week 1-2: ... Week 3-4: ...",
-      "launch_strategy": "Launch on ..., reach out to ..., onboard first users via ..."
-    }}
-
-    AGAIN: Output MUST be a single valid JSON object matching that schema. No markdown, no commentary, no multiple JSON objects.
+    "{IDEA_PLACEHOLDER}"
+
+    RULES: be practical and specific to THIS idea; write "Unknown" or "Best guess: ..." when unsure; never invent metrics, statistics or company names; 3–8 sentences per field; output ONLY a single JSON object, no markdown or commentary.
     """).strip()
 
-    task = Task(
-        description=description,
-        agent=startup_orchestrator,
-        expected_output="A single JSON object with all required keys."
+BATCH_PLAN_PROMPT = dedent("""
+    As a crew of startup specialists (market analyst, business model architect, technical architect, MVP roadmap planner, GTM strategist), turn EACH raw idea below into its own ACTIONABLE startup plan.
+
+    IDEAS:
+    {IDEAS_PLACEHOLDER}
+
+    RULES: be practical and specific to each idea, never mix details between them; write "Unknown" or "Best guess: ..." when unsure; never invent metrics, statistics or company names; 3–8 sentences per field; output ONLY a single JSON object {"plans": [...]} holding exactly {COUNT_PLACEHOLDER} plans in the same order as the ideas, no markdown or commentary.
+    """).strip()
+
+# Micro-batching for /plan (opt-in via PLAN_BATCHING): ideas arriving within
+# MAX_WAIT seconds of each other are planned together in one crew run (at
+# most MAX_BATCH per run). Off by default, since a batch mixes unrelated
+# users' ideas into one prompt.
+MAX_BATCH = 8
+MAX_WAIT = 0.05
+
+def build_crew_factory() -> CrewFactory:
+    """
+    Build the LLM + orchestrator agent once and return a factory that
+    only creates the per-request Task/Crew for a task description.
+    """
+    llm = LLM(
+        model=MODEL_NAME,
+        api_key=OPENAI_API_KEY,
+        temperature=MODEL_TEMPERATURE,
     )
 
-    crew = Crew(
-        agents=[startup_orchestrator],
-        tasks=[task],
-        process=Process.sequential,
+    startup_orchestrator = Agent(
+        role="Startup Builder Orchestrator",
+        goal=(
+            "Given a startup idea, act as a crew of specialists (market analyst, "
+            "business model architect, technical architect, roadmap planner, GTM strategist) "
+            "and produce a realistic startup blueprint in STRICT JSON."
+        ),
+        backstory=(
+            "You have helped many founders refine messy ideas into clear, structured plans. "
+            "You hate hallucinating. If details are unknown, you explicitly say 'Unknown' or "
+            "'Best guess: ...' instead of making up fake numbers or companies."
+        ),
+        llm=llm,
+        verbose=True,
     )
 
-    raw_result = crew.kickoff()
-    raw_text = str(raw_result).strip()
+    def make_crew(description: str, expected_output: str, output_json: type[BaseModel]) -> Crew:
+        task = Task(
+            description=description,
+            agent=startup_orchestrator,
+            expected_output=expected_output,
+            output_json=output_json,
+        )
+        return Crew(
+            agents=[startup_orchestrator],
+            tasks=[task],
+            process=Process.sequential,
+        )
 
-    try:
-        data = json.loads(raw_text)
-    except json.JSONDecodeError as e:
-        # If the model messes up formatting, surface the raw text for debugging
-        raise ValueError(f"Model did not return valid JSON. Raw output was:\n{raw_text}") from e
-
-    # Ensure all keys exist so FastAPI / frontend don't break
-    required_keys = [
-        "idea",
-        "problem_summary",
-        "solution_summary",
-        "target_audience",
-        "market_and_competition",
-        "revenue_model",
-        "tech_architecture",
-        "mvp_roadmap",
-        "launch_strategy",
-    ]
-    for key in required_keys:
-        if key not in data or data[key] is None:
-            data[key] = "Unknown"
-
-    return data
+    return make_crew
+
+def _crew_json(result: CrewOutput) -> dict:
+    # json_dict is only set when the output validated against output_json
+    if result.json_dict is None:
+        raise ValueError(f"Model did not return valid JSON. Raw output was:\n{result.raw}")
+    return result.json_dict
+
+async def run_startup_crew(crew_factory: CrewFactory, idea: str) -> dict:
+    """
+    Use a CrewAI Agent to generate a structured startup plan as JSON.
+    """
+    crew = crew_factory(
+        PLAN_PROMPT.replace("{IDEA_PLACEHOLDER}", idea),
+        "A single JSON object with all required keys.",
+        GeneratedStartupPlan,
+    )
+
+    result = await crew.akickoff()
+    return _crew_json(result)
+
+async def run_startup_crew_batch(crew_factory: CrewFactory, ideas: list[str]) -> list[dict]:
+    """
+    Generate one startup plan per idea with a single crew run.
+    """
+    # JSON-encode each idea so quotes/newlines can't bleed into the list
+    numbered = "\n".join(
+        f"{i}. {orjson.dumps(idea).decode()}" for i, idea in enumerate(ideas, start=1)
+    )
+    crew = crew_factory(
+        BATCH_PLAN_PROMPT
+            .replace("{COUNT_PLACEHOLDER}", str(len(ideas)))
+            .replace("{IDEAS_PLACEHOLDER}", numbered),
+        f'A JSON object {{"plans": [...]}} with exactly {len(ideas)} plans.',
+        StartupPlanBatch,
+    )
+
+    result = await crew.akickoff()
+    plans = _crew_json(result)["plans"]
+
+    if len(plans) != len(ideas):
+        raise ValueError(f"Model did not return {len(ideas)} plans. Raw output was:\n{result.raw}")
+
+    return plans
+
+class PlanBatcher:
+    """
+    Coalesce concurrent plan requests into multi-idea crew runs.
+
+    Callers await submit(idea); a single worker task drains the queue into
+    batches of up to max_batch ideas (waiting at most MAX_WAIT seconds for
+    a batch to fill) and resolves each caller's future with its own plan.
+    With max_batch=1 every idea gets its own crew run right away.
+    """
+
+    def __init__(self, crew_factory: CrewFactory, max_batch: int = MAX_BATCH):
+        self.crew_factory = crew_factory
+        self.max_batch = max_batch
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._worker, *self._inflight) if t is not None]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def submit(self, idea: str) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((idea, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + MAX_WAIT
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # don't block the next batch from forming while this one runs
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        # skip callers that went away (e.g. client disconnected)
+        batch = [(idea, fut) for idea, fut in batch if not fut.done()]
+        if not batch:
+            return
+
+        ideas = [idea for idea, _ in batch]
+        results: list = []
+        if len(ideas) > 1:
+            try:
+                results = await run_startup_crew_batch(self.crew_factory, ideas)
+            except Exception:
+                # one bad batch (malformed plan, wrong count, ...) must not
+                # fail unrelated callers, so retry each idea on its own
+                results = []
+
+        if not results:
+            results = await asyncio.gather(
+                *(run_startup_crew(self.crew_factory, idea) for idea in ideas),
+                return_exceptions=True,
+            )
+
+        for (_, fut), result in zip(batch, results):
+            if fut.done():
+                continue
+            if isinstance(result, BaseException):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
+async def get_plan(batcher: PlanBatcher, idea: str) -> dict:
+    """
+    Generate a plan, sharing one crew run between concurrent identical
+    requests. Finished plans are not cached: the frontend's "regenerate"
+    re-posts the same idea and expects a fresh plan.
+    """
+    key = cache_key("plan", MODEL_NAME, MODEL_TEMPERATURE, idea)
+    return await response_cache.get_or_compute(key, lambda: batcher.submit(idea), store=False)
 
 # ---------------------------
 # FastAPI app
 # ---------------------------
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # one pooled HTTP/2 connection set shared by every OpenAI call;
+    # DefaultAsyncHttpxClient keeps the SDK's timeout/redirect defaults
+    app.state.openai_client = AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
+
+    # Agent/LLM construction is expensive, do it once at startup
+    app.state.crew_factory = build_crew_factory()
+    app.state.plan_batcher = PlanBatcher(
+        app.state.crew_factory,
+        max_batch=MAX_BATCH if settings.plan_batching else 1,
+    )
+    app.state.plan_batcher.start()
+    app.state.run_store = create_run_store(settings.redis_url)
+    yield
+    await app.state.plan_batcher.stop()
+    await app.state.run_store.close()
+    await app.state.openai_client.close()
+
 app = FastAPI(
     title="AI Startup Builder API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # relax dev, tighten in prod
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[settings.frontend_url],
+    allow_methods=["POST", "GET"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # let browsers cache preflights for a day
 )
 
 @app.get("/health")
-def health_check():
+def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 @app.post("/api/startup/plan", response_model=StartupPlan)
-def generate_startup_plan(payload: StartupRequest):
+async def generate_startup_plan(payload: StartupRequest, request: Request):
     try:
-        data = run_startup_crew(payload.idea)
+        data = await get_plan(request.app.state.plan_batcher, payload.idea)
     except ValueError as e:
         # JSON parse issues from the model
         raise HTTPException(status_code=500, detail=str(e))
@@ -194,16 +310,32 @@ def generate_startup_plan(payload: StartupRequest):
 
     return StartupPlan(**data)
 
-@app.post("/api/startup/critique")
-def critique_plan(payload: dict):
-    """Generate deep critique using OpenAI."""
-    idea = payload.get("idea", "")
-    plan = payload.get("plan", {})
-
-    if not idea or not plan:
-        raise HTTPException(status_code=400, detail="idea and plan required")
-
-    prompt = f"""
+# run state is {"status": "running" | "done" | "error", ...}
+async def _execute_plan_run(run_store: RunStore, run_id: str, batcher: PlanBatcher, idea: str) -> None:
+    try:
+        data = await get_plan(batcher, idea)
+        await run_store.set(run_id, {"status": "done", "result": StartupPlan(**data).model_dump()})
+    except Exception as e:
+        await run_store.set(run_id, {"status": "error", "error": str(e)})
+
+@app.post("/api/startup/plan/runs", response_model=PlanRunCreated, status_code=202)
+async def start_plan_run(payload: StartupRequest, request: Request, background_tasks: BackgroundTasks):
+    """Start plan generation in the background and return a run_id to poll."""
+    run_store = request.app.state.run_store
+    run_id = uuid4().hex
+    await run_store.set(run_id, {"status": "running"})
+    background_tasks.add_task(_execute_plan_run, run_store, run_id, request.app.state.plan_batcher, payload.idea)
+    return {"run_id": run_id}
+
+@app.get("/api/startup/plan/runs/{run_id}", response_model=PlanRun, response_model_exclude_none=True)
+async def get_plan_run(run_id: str, request: Request):
+    run = await request.app.state.run_store.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="run not found")
+    return {"run_id": run_id, **run}
+
+def _critique_prompt(idea: str, plan: dict) -> str:
+    return f"""
 You are a VC-level startup analyst.
 
 CRITIQUE THIS IDEA + PLAN DEEPLY:
@@ -212,7 +344,7 @@ Idea:
 {idea}
 
 Plan:
-{json.dumps(plan, indent=2)}
+{orjson.dumps(plan, option=orjson.OPT_INDENT_2).decode()}
 
 FORMAT THE OUTPUT AS:
 - 🔥 Overall thesis
@@ -222,100 +354,316 @@ FORMAT THE OUTPUT AS:
 - 🚀 Execution steps
     """
 
-    try:
-        response = client.responses.create(
+def _pitch_prompt(idea: str, plan: dict) -> str:
+    return f"""
+Turn this idea + plan into a 10-slide pitch deck.
+
+Idea:
+{idea}
+
+Plan:
+{orjson.dumps(plan, option=orjson.OPT_INDENT_2).decode()}
+
+Format strictly as JSON LIST:
+[
+  {{"title": "...", "content": "..."}},
+  ...
+]
+    """
+
+# appended to a streamed body when the model stream fails after the 200
+# headers have already gone out
+STREAM_ERROR_MARKER = "\n[STREAM ERROR] "
+
+async def stream_text(
+    client: AsyncOpenAI, prompt: str, temperature: float
+) -> tuple[AsyncIterator[str], Callable[[], Awaitable[None]]]:
+    """
+    Open the model stream and return (text deltas, close).
+
+    The request is sent before this returns, so upstream failures (auth,
+    rate limits, timeouts) raise here, while the caller can still answer
+    with a proper error status. Failures mid-stream end the body with
+    STREAM_ERROR_MARKER and the error message. close() is idempotent and
+    must run even if the deltas are never iterated; TextStreamResponse
+    takes care of that.
+    """
+    stack = AsyncExitStack()
+    stream = await stack.enter_async_context(
+        client.responses.stream(
+            model=MODEL_NAME,
+            input=prompt,
+            temperature=temperature,
+        )
+    )
+
+    async def deltas() -> AsyncIterator[str]:
+        try:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+                elif event.type in ("error", "response.failed"):
+                    yield f"{STREAM_ERROR_MARKER}{getattr(event, 'message', None) or event.type}"
+                    return
+        except Exception as e:
+            yield f"{STREAM_ERROR_MARKER}{e}"
+        finally:
+            await stack.aclose()
+
+    return deltas(), stack.aclose
+
+class TextStreamResponse(StreamingResponse):
+    """
+    Plain-text StreamingResponse that always releases the upstream model
+    stream. If the client disconnects before the body is iterated,
+    Starlette runs neither the generator's finally nor background tasks,
+    which would leak a pooled connection.
+    """
+
+    def __init__(self, deltas: AsyncIterator[str], close: Callable[[], Awaitable[None]]):
+        super().__init__(deltas, media_type="text/plain; charset=utf-8")
+        self._close = close
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._close()
+
+async def run_critique(client: AsyncOpenAI, idea: str, plan: dict) -> str:
+    """Generate a VC-style critique of the idea + plan."""
+    prompt = _critique_prompt(idea, plan)
+
+    async def call() -> str:
+        response = await client.responses.create(
             model=MODEL_NAME,
             input=prompt,
             temperature=MODEL_TEMPERATURE,
         )
-        critique_text = response.output_text
-        return { "critique": critique_text }
+        return response.output_text
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Critique generation failed: {str(e)}")
+    key = cache_key("critique", MODEL_NAME, MODEL_TEMPERATURE, prompt)
+    return await response_cache.get_or_compute(key, call)
 
+async def run_pitch(client: AsyncOpenAI, idea: str, plan: dict) -> list[Slide]:
+    """Generate a 10-slide pitch deck as a list of {title, content}."""
+    prompt = _pitch_prompt(idea, plan)
 
-@app.post("/api/startup/pitch")
-def generate_pitch(payload: dict):
-    idea = payload.get("idea", "")
-    plan = payload.get("plan", {})
+    async def call() -> list[Slide]:
+        response = await client.responses.create(
+            model=MODEL_NAME,
+            input=prompt,
+            temperature=0.2,
+        )
+        # validate here so a malformed deck fails the call and is never cached
+        return SLIDES_ADAPTER.validate_python(orjson.loads(response.output_text))
 
-    if not idea or not plan:
-        raise HTTPException(status_code=400, detail="idea and plan required")
+    key = cache_key("pitch", MODEL_NAME, 0.2, prompt)
+    return await response_cache.get_or_compute(key, call)
 
+async def run_bundle(client: AsyncOpenAI, idea: str, plan: dict) -> BundleResponse:
+    """Generate critique + pitch deck with a single LLM call."""
     prompt = f"""
-Turn this idea + plan into a 10-slide pitch deck.
+You are a VC-level startup analyst. For the idea + plan below, produce BOTH:
+
+1. A deep critique formatted as:
+- 🔥 Overall thesis
+- ✅ What is strong
+- ⚠️ What is weak
+- 🧪 What MUST be validated first
+- 🚀 Execution steps
+
+2. A 10-slide pitch deck.
 
 Idea:
 {idea}
 
 Plan:
-{json.dumps(plan, indent=2)}
-
-Format strictly as JSON LIST:
-[
-  {{"title": "...", "content": "..."}},
-  ...
-]
+{orjson.dumps(plan, option=orjson.OPT_INDENT_2).decode()}
+
+Respond ONLY with a single JSON object using EXACTLY this schema:
+{{
+  "critique": "string - the full critique in the format above",
+  "slides": [
+    {{"title": "...", "content": "..."}},
+    ...
+  ]
+}}
     """
 
-    try:
-        response = client.responses.create(
+    async def call() -> BundleResponse:
+        response = await client.responses.create(
             model=MODEL_NAME,
             input=prompt,
-            temperature=0.2,
+            temperature=0.2,  # same as pitch, output must stay valid JSON
         )
-        raw = response.output_text
+        # validate here so a malformed bundle fails the call and is never cached
+        return BundleResponse.model_validate(orjson.loads(response.output_text))
+
+    key = cache_key("bundle", MODEL_NAME, 0.2, prompt)
+    return await response_cache.get_or_compute(key, call)
+
+@app.post("/api/startup/critique", response_model=CritiqueResponse)
+async def critique_plan(payload: CritiqueRequest, request: Request):
+    """Generate deep critique using OpenAI."""
+    idea = payload.idea
+    plan = payload.plan.model_dump()
+
+    try:
+        critique_text = await run_critique(request.app.state.openai_client, idea, plan)
+        return { "critique": critique_text }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Critique generation failed: {str(e)}")
+
 
-        deck = json.loads(raw)
+@app.post("/api/startup/pitch", response_model=PitchResponse)
+async def generate_pitch(payload: PitchRequest, request: Request):
+    idea = payload.idea
+    plan = payload.plan.model_dump()
+
+    try:
+        deck = await run_pitch(request.app.state.openai_client, idea, plan)
         return { "slides": deck }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Pitch deck generation failed: {str(e)}")
 
 
-from fastapi.responses import FileResponse
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-import tempfile
+@app.post("/api/startup/critique/stream")
+async def critique_plan_stream(payload: CritiqueRequest, request: Request):
+    """Same as /critique, but streams the text as the model writes it."""
+    idea = payload.idea
+    plan = payload.plan.model_dump()
+
+    try:
+        deltas, close = await stream_text(request.app.state.openai_client, _critique_prompt(idea, plan), MODEL_TEMPERATURE)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Critique generation failed: {str(e)}")
+
+    return TextStreamResponse(deltas, close)
+
+
+@app.post("/api/startup/pitch/stream")
+async def generate_pitch_stream(payload: PitchRequest, request: Request):
+    """Same as /pitch, but streams the raw JSON deck text as it is generated."""
+    idea = payload.idea
+    plan = payload.plan.model_dump()
+
+    try:
+        deltas, close = await stream_text(request.app.state.openai_client, _pitch_prompt(idea, plan), 0.2)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Pitch deck generation failed: {str(e)}")
+
+    return TextStreamResponse(deltas, close)
 
-@app.post("/api/startup/pdf")
-def generate_pdf(payload: dict):
-    """Generate a real PDF pitch deck."""
-    slides = payload.get("slides", [])
 
-    if not slides:
-        raise HTTPException(status_code=400, detail="slides missing")
+@app.post("/api/startup/bundle", response_model=BundleResponse)
+async def generate_bundle(payload: BundleRequest, request: Request):
+    """Critique + pitch deck in one prompt / one LLM round-trip."""
+    idea = payload.idea
+    plan = payload.plan.model_dump()
 
-    temp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    pdf_path = temp.name
-    temp.close()
+    try:
+        return await run_bundle(request.app.state.openai_client, idea, plan)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Bundle generation failed: {str(e)}")
+
+
+@app.post("/api/startup/full", response_model=FullResponse)
+async def generate_full(payload: StartupRequest, request: Request):
+    """Plan, then critique + pitch concurrently, in a single round-trip."""
+    try:
+        data = await get_plan(request.app.state.plan_batcher, payload.idea)
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {e}")
 
-    c = canvas.Canvas(pdf_path, pagesize=letter)
+    plan = StartupPlan(**data).model_dump()
+
+    # critique and pitch only depend on the plan, so run them side by side
+    client = request.app.state.openai_client
+    try:
+        critique_text, deck = await asyncio.gather(
+            run_critique(client, payload.idea, plan),
+            run_pitch(client, payload.idea, plan),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Critique/pitch generation failed: {str(e)}")
+
+    return { "plan": plan, "critique": critique_text, "slides": deck }
+
+
+import io
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen import canvas
+from reportlab.pdfgen.textobject import PDFTextObject
+
+TITLE_FONT = ("Helvetica-Bold", 20)
+BODY_FONT = ("Helvetica", 12)
+BODY_LEADING = 20
+
+def _start_slide_page(c: canvas.Canvas, title: str, height: float) -> PDFTextObject:
+    """
+    Begin a page's text object with the slide title drawn and the body font
+    selected. Title and body share one BT/ET block, so each font is set
+    exactly once per page.
+    """
+    text = c.beginText(50, height - 80)
+    text.setFont(*TITLE_FONT)
+    text.textOut(title)
+    text.setTextOrigin(50, height - 120)
+    text.setFont(*BODY_FONT, leading=BODY_LEADING)
+    return text
+
+def _wrap_lines(content: str, max_width: float) -> list[str]:
+    """Split slide content into lines that fit max_width in the body font."""
+    lines = []
+    for paragraph in content.splitlines():
+        # simpleSplit drops empty lines, keep them as paragraph spacing
+        lines.extend(simpleSplit(paragraph, *BODY_FONT, max_width) or [""])
+    return lines
+
+def _render_pdf(slides: list[Slide]) -> bytes:
+    """Render slides into an in-memory PDF and return its bytes."""
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
     width, height = letter
 
     for slide in slides:
-        title = slide["title"]
-        content = slide["content"]
-
-        c.setFont("Helvetica-Bold", 20)
-        c.drawString(50, height - 80, title)
+        title = slide.title
+        lines = _wrap_lines(slide.content, width - 100)
 
-        c.setFont("Helvetica", 12)
+        text = _start_slide_page(c, title, height)
 
-        y = height - 120
-        for line in content.split("\n"):
-            c.drawString(50, y, line)
-            y -= 20
-            if y < 80:
+        for line in lines:
+            text.textLine(line)
+            if text.getY() < 80:
+                c.drawText(text)
                 c.showPage()
-                c.setFont("Helvetica-Bold", 20)
-                c.drawString(50, height - 80, title)
-                c.setFont("Helvetica", 12)
-                y = height - 120
+                text = _start_slide_page(c, title, height)
 
+        c.drawText(text)
         c.showPage()
 
     c.save()
+    return buf.getvalue()
 
-    return FileResponse(pdf_path, filename="pitchdeck.pdf")
+@app.post("/api/startup/pdf")
+async def generate_pdf(payload: PDFRequest):
+    """Generate a real PDF pitch deck."""
+    slides = payload.slides
+
+    # ReportLab rendering is CPU-bound, run it in a worker thread
+    pdf = await asyncio.to_thread(_render_pdf, slides)
+
+    # already fully in memory, send it in one go
+    return Response(
+        pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": 'attachment; filename="pitchdeck.pdf"'},
+    )
@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+
+import orjson
+from redis.asyncio import Redis
+
+
+class MemoryRunStore:
+    """
+    In-process run store. Fine for a single worker; with several workers a
+    poll can hit a process that never saw the run.
+
+    Runs expire after ttl seconds, matching RedisRunStore, and at most
+    maxsize runs are kept (oldest evicted first).
+    """
+
+    def __init__(self, ttl: int = 3600, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # run_id -> (expires_at, state), oldest write first
+        self._runs: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._runs:
+            run_id, (expires_at, _) = next(iter(self._runs.items()))
+            if expires_at > now and len(self._runs) <= self.maxsize:
+                break
+            del self._runs[run_id]
+
+    async def set(self, run_id: str, state: dict) -> None:
+        # like redis SET ... EX, every write restarts the TTL
+        self._runs[run_id] = (time.monotonic() + self.ttl, state)
+        self._runs.move_to_end(run_id)
+        self._evict()
+
+    async def get(self, run_id: str) -> dict | None:
+        entry = self._runs.get(run_id)
+        if entry is None:
+            return None
+        expires_at, state = entry
+        if expires_at <= time.monotonic():
+            del self._runs[run_id]
+            return None
+        return state
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisRunStore:
+    """Run store shared by all workers, keyed as run:{run_id} with a TTL."""
+
+    def __init__(self, url: str, ttl: int = 3600):
+        self.redis = Redis.from_url(url)
+        self.ttl = ttl
+
+    async def set(self, run_id: str, state: dict) -> None:
+        await self.redis.set(f"run:{run_id}", orjson.dumps(state), ex=self.ttl)
+
+    async def get(self, run_id: str) -> dict | None:
+        raw = await self.redis.get(f"run:{run_id}")
+        if raw is None:
+            return None
+        return orjson.loads(raw)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+RunStore = MemoryRunStore | RedisRunStore
+
+
+def create_run_store(redis_url: str | None) -> RunStore:
+    """Use Redis when REDIS_URL is configured, otherwise keep runs in memory."""
+    if redis_url:
+        return RedisRunStore(redis_url)
+    return MemoryRunStore()
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 class StartupRequest(BaseModel):
-    idea: str
+    idea: str = Field(min_length=1, max_length=4000)
 
 class StartupPlan(BaseModel):
     idea: str
@@ -13,3 +13,85 @@ class StartupPlan(BaseModel):
     tech_architecture: str
     mvp_roadmap: str
     launch_strategy: str
+
+class GeneratedStartupPlan(BaseModel):
+    """
+    Lenient StartupPlan used to validate LLM output: missing or null fields
+    come back as "Unknown" instead of failing validation.
+    """
+    idea: str = Field(
+        "Unknown", description="Restate the idea clearly in your own words"
+    )
+    problem_summary: str = Field(
+        "Unknown", description="The core pain/need being solved"
+    )
+    solution_summary: str = Field(
+        "Unknown", description="The actual product / service and how it works"
+    )
+    target_audience: str = Field(
+        "Unknown", description="2-3 main personas + their characteristics and pain points"
+    )
+    market_and_competition: str = Field(
+        "Unknown", description="How people solve this today, types of competitors, and differentiation"
+    )
+    revenue_model: str = Field(
+        "Unknown", description="Business model, pricing logic, potential tiers"
+    )
+    tech_architecture: str = Field(
+        "Unknown", description="High-level architecture: frontend, backend, DB, AI components, integrations"
+    )
+    mvp_roadmap: str = Field(
+        "Unknown", description="Realistic 4-8 week roadmap in phases or weeks"
+    )
+    launch_strategy: str = Field(
+        "Unknown", description="First launch channels, first 100 users, and feedback loop"
+    )
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def none_to_unknown(cls, value):
+        return "Unknown" if value is None else value
+
+class StartupPlanBatch(BaseModel):
+    plans: list[GeneratedStartupPlan]
+
+class CritiqueRequest(BaseModel):
+    idea: str = Field(min_length=1, max_length=4000)
+    plan: StartupPlan
+
+class PitchRequest(CritiqueRequest):
+    pass
+
+class BundleRequest(CritiqueRequest):
+    pass
+
+class Slide(BaseModel):
+    title: str
+    content: str
+
+class PDFRequest(BaseModel):
+    slides: list[Slide] = Field(min_length=1)
+
+class CritiqueResponse(BaseModel):
+    critique: str
+
+class PitchResponse(BaseModel):
+    slides: list[Slide]
+
+class BundleResponse(BaseModel):
+    critique: str
+    slides: list[Slide]
+
+class FullResponse(BaseModel):
+    plan: StartupPlan
+    critique: str
+    slides: list[Slide]
+
+class PlanRunCreated(BaseModel):
+    run_id: str
+
+class PlanRun(BaseModel):
+    run_id: str
+    status: str
+    result: StartupPlan | None = None
+    error: str | None = None
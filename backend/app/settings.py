@@ -0,0 +1,43 @@
+import os
+import functools
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_PATH = os.path.join(BASE_DIR, ".env")
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    openai_api_key: str
+    model_name: str
+    model_temperature: float
+    redis_url: str | None = None
+    frontend_url: str = "http://localhost:3000"
+    plan_batching: bool = False
+
+
+@functools.cache
+def _load_env_file(path: str) -> None:
+    # don't override values already in the environment
+    load_dotenv(path, override=False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env once and return the immutable app settings."""
+    _load_env_file(ENV_PATH)
+
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise RuntimeError(f"OPENAI_API_KEY is not set. Checked .env at: {ENV_PATH}")
+
+    return Settings(
+        openai_api_key=openai_api_key,
+        model_name=os.getenv("MODEL_NAME", "gpt-4.1-mini"),
+        model_temperature=float(os.getenv("MODEL_TEMPERATURE", "0.4")),
+        redis_url=os.getenv("REDIS_URL") or None,
+        frontend_url=os.getenv("FRONTEND_URL", "http://localhost:3000"),
+        plan_batching=os.getenv("PLAN_BATCHING", "").lower() in ("1", "true", "yes"),
+    )